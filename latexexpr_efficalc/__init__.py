@@ -561,6 +561,13 @@ _supportedOperations = (
     _supportedOperations1 + _supportedOperations2 + _supportedOperationsN
 )
 
+# the per-arity groups are only ever used for membership tests (which run on
+# every Operation construction, formatting and evaluation), so freeze them;
+# _supportedOperations stays a tuple to keep error messages ordered
+_supportedOperations1 = frozenset(_supportedOperations1)
+_supportedOperations2 = frozenset(_supportedOperations2)
+_supportedOperationsN = frozenset(_supportedOperationsN)
+
 
 class Operation(object):
     r"""Class representing mathematical operation applied to one, two or more objects. These objects may be of type Variable, Expression or Operation again, allowing builing a hieararchy of operations. Preferable way of creation of Operation instances is to use predefined functions (see :ref:`predefinedOperations`) or (where it is possible) standard Python operations +,-,*,/,**.
@@ -39,12 +39,12 @@ If `sympy <http://www.sympy.org>`_ is present, it also defines aforementioned me
 	>>> print e1
 	e1 = {v1} + {v1} + {v2} + {v3} + {v2} + {v3} - {v4}
 	>>> print lsympy.simplify(e1)
-	e1 = \left( - {v4} \right) + {2} \cdot {v1} + {2} \cdot {v2} + {2} \cdot {v3}
+	e1 = {2} \cdot {v1} + {2} \cdot {v2} + {2} \cdot {v3} - {v4}
 	>>> print lsympy.simplify(e1,substituteFloats=True)
 	e1 = {-2.1} + {2} \cdot {v1} + {2} \cdot {v2}
 	>>> e1.simplify()
 	>>> print e1
-	e1 = \left( - {v4} \right) + {2} \cdot {v1} + {2} \cdot {v2} + {2} \cdot {v3}
+	e1 = {2} \cdot {v1} + {2} \cdot {v2} + {2} \cdot {v3} - {v4}
 	>>> e1.simplify(substituteFloats=True)
 	>>> print e1
 	e1 = {-2.1} + {2} \cdot {v1} + {2} \cdot {v2}
@@ -56,7 +56,6 @@ If `sympy <http://www.sympy.org>`_ is present, it also defines aforementioned me
 	e3 = {-1} + {x}
 """
 
-import copy
 import latexexpr_efficalc
 
 try:
@@ -66,123 +65,402 @@ except ImportError:
         "module 'sympy' is not available, therefore latexexpr_efficalc.sympy will not be available"
     )
 
+# optional symengine backend (C++ core mirroring the sympy API). Expression
+# trees are built with _sym.* so construction runs in symengine when it is
+# installed; results are converted back to sympy before further processing
+try:
+    import symengine as _sym
+except ImportError:
+    _sym = sympy
+
+# optional numba JIT for the numeric functions produced by :func:`.lambdify`
+try:
+    import numba as _numba
+except ImportError:
+    _numba = None
+
+
+def _apply_backend(name, s, **kw):
+    # apply the named symbolic function (simplify, expand, ...) to s,
+    # preferring the symengine backend when it provides the function and no
+    # sympy-specific keywords were requested; always returns a sympy expression
+    if _sym is not sympy and not kw:
+        func = getattr(_sym, name, None)
+        if func is not None:
+            return sympy.sympify(func(s))
+    return getattr(sympy, name)(sympy.sympify(s), **kw)
+
+
+# kind tags attached to the efficalc classes so _operation_to_sympy can
+# dispatch with one attribute fetch instead of repeated isinstance probes
+latexexpr_efficalc.Variable._KIND = "variable"
+latexexpr_efficalc.Expression._KIND = "expression"
+latexexpr_efficalc.Operation._KIND = "operation"
+
+if _sym is sympy:
+    # building with evaluate=False skips sympy's eager flattening and
+    # canonicalization of every intermediate node; the downstream call
+    # (simplify/expand/...) canonicalizes the finished tree once instead.
+    # symengine constructors take no such flag (its canonicalization is
+    # cheap C++), so the plain constructors are used there
+    def _addOp(*a):
+        # splice nested Adds so chains like v1+v2+...+vN stay flat; sympy
+        # would otherwise recurse through N levels later on
+        args = []
+        for x in a:
+            args.extend(x.args) if isinstance(x, sympy.Add) else args.append(x)
+        return sympy.Add(*args, evaluate=False)
+
+    def _mulOp(*a):
+        args = []
+        for x in a:
+            args.extend(x.args) if isinstance(x, sympy.Mul) else args.append(x)
+        return sympy.Mul(*args, evaluate=False)
+
+else:
+    _addOp = _sym.Add
+    _mulOp = _sym.Mul
+
+
+# dispatch table mapping Operation type constants to builders of the
+# corresponding backend node; builders receive already converted arguments
+_OP_TABLE = {
+    latexexpr_efficalc._ADD: _addOp,
+    latexexpr_efficalc._MUL: _mulOp,
+    # subtraction, division and negation go through _addOp/_mulOp too: on a
+    # left-associative chain a-b-c-d the evaluated constructors would
+    # re-flatten and re-sort the growing argument list at every level (O(N^2)
+    # overall), while the flattening constructors splice into one flat node
+    latexexpr_efficalc._SUB: lambda a, b: _addOp(a, _mulOp(_MINUS_ONE, b)),
+    latexexpr_efficalc._DIV: lambda a, b: _mulOp(a, _sym.Pow(b, _MINUS_ONE)),
+    latexexpr_efficalc._DIV2: lambda a, b: _mulOp(a, _sym.Pow(b, _MINUS_ONE)),
+    latexexpr_efficalc._POW: lambda a, b: _sym.Pow(a, b),
+    latexexpr_efficalc._ROOT: lambda a, b: _sym.Pow(b, _sym.Pow(a, _MINUS_ONE)),
+    latexexpr_efficalc._LOG: lambda a, b: _sym.log(a, b),
+    latexexpr_efficalc._NEG: lambda a: _mulOp(_MINUS_ONE, a),
+    latexexpr_efficalc._ABS: lambda a: _sym.Abs(a),
+    latexexpr_efficalc._SQR: lambda a: _sym.Pow(a, _TWO),
+    latexexpr_efficalc._SQRT: lambda a: _sym.Pow(a, _HALF),
+    latexexpr_efficalc._SIN: lambda a: _sym.sin(a),
+    latexexpr_efficalc._COS: lambda a: _sym.cos(a),
+    latexexpr_efficalc._TAN: lambda a: _sym.tan(a),
+    latexexpr_efficalc._SINH: lambda a: _sym.sinh(a),
+    latexexpr_efficalc._COSH: lambda a: _sym.cosh(a),
+    latexexpr_efficalc._TANH: lambda a: _sym.tanh(a),
+    latexexpr_efficalc._EXP: lambda a: _sym.exp(a),
+    latexexpr_efficalc._LN: lambda a: _sym.log(a),
+    latexexpr_efficalc._LOG10: lambda a: _sym.log(a, 10),
+}
+
+# caches shared by all conversion runs: backend Symbols per variable name and
+# backend numbers per value, so repeated variables and the ubiquitous small
+# constants (-1, 2, ...) are not rebuilt on every node
+_SYMBOL_CACHE = {}
+_NUMBER_CACHE = {}
+
+
+def _symbol(name):
+    sym = _SYMBOL_CACHE.get(name)
+    if sym is None:
+        sym = _SYMBOL_CACHE[name] = _sym.Symbol(name)
+    return sym
+
+
+def _number(value):
+    num = _NUMBER_CACHE.get(value)
+    if num is None:
+        num = _NUMBER_CACHE[value] = _sym.sympify(value)
+    return num
+
+
+# shared nodes for the constants every negation, division and square builds,
+# so the operation builders never re-intern them
+_MINUS_ONE = _number(-1)
+_TWO = _number(2)
+_HALF = _sym.Rational(1, 2)
+
+
+# operations that are only typographic and convert as their single argument
+_TRANSPARENT_OPS = frozenset(
+    (
+        latexexpr_efficalc._NONE,
+        latexexpr_efficalc._RBRACKETS,
+        latexexpr_efficalc._SBRACKETS,
+        latexexpr_efficalc._CBRACKETS,
+        latexexpr_efficalc._ABRACKETS,
+        latexexpr_efficalc._POS,
+    )
+)
+
 
-def _operation_to_sympy(arg, varMap=None, substituteFloats=True):
+def _literal(name, value):
+    # numeric literal Variable tagged so _variable_to_sympy recognizes it
+    # without re-parsing the name
+    ret = latexexpr_efficalc.Variable(name, value)
+    ret._is_literal = True
+    return ret
+
+
+def _is_literal(arg):
+    # a Variable whose name is just its numeric value converts as a plain
+    # number; those built by _sympy2operation carry the tag directly, others
+    # (the auto-wrapped int/float constants) are detected by parsing the
+    # name once, which is cheaper than formatting the value with %g
+    if getattr(arg, "_is_literal", False):
+        return True
+    try:
+        return float(arg.name) == arg.value
+    except ValueError:
+        return False
+
+
+def _collect_symbolic_vars(arg, varMap, sf):
+    # single pre-pass filling varMap with every Variable that converts to a
+    # Symbol, so the conversion walk below stays free of dict mutation;
+    # subtrees the substituteFloats fast path folds away are skipped whole
+    stack = [arg]
+    seen = set()
+    while stack:
+        node = stack.pop()
+        key = id(node)
+        if key in seen:
+            continue
+        seen.add(key)
+        kind = getattr(node, "_KIND", None)
+        if kind is None or (sf and not node.is_symbolic()):
+            continue
+        if kind == "variable":
+            if node.is_symbolic() or not _is_literal(node):
+                varMap[node.name] = node
+        elif kind == "expression":
+            stack.append(node.operation)
+        else:
+            stack.extend(node.args)
+
+
+def _variable_to_sympy(arg, sf, memo):
+    key = (arg.name, arg.value)
+    if key in memo:
+        return memo[key]
+    if not arg.is_symbolic() and _is_literal(arg):
+        ret = _number(int(arg) if arg.value == int(arg.value) else float(arg))
+    elif not sf or arg.is_symbolic():
+        ret = _symbol(arg.name)
+    else:
+        ret = float(arg)
+    memo[key] = ret
+    return ret
+
+
+def _operation_to_sympy(arg, varMap=None, substituteFloats=True, memo=None):
     sf = substituteFloats
     if varMap is None:
         varMap = {}
-    if isinstance(arg, latexexpr_efficalc.Variable):
-        if not arg.is_symbolic() and arg.name == "%g" % arg.value:
-            if arg.value == int(arg.value):
-                return int(arg), varMap
-            return float(arg), varMap
-        if not sf or arg.is_symbolic():
-            varMap[arg.name] = arg
-            return sympy.Symbol(arg.name), varMap
-        return float(arg), varMap
-    if isinstance(arg, latexexpr_efficalc.Expression):
-        return _operation_to_sympy(arg.operation, varMap, sf)
-    if not isinstance(arg, latexexpr_efficalc.Operation):
-        raise TypeError("TODO " + str(type(arg)) + str(arg))
-    t = arg.type
-    if t in latexexpr_efficalc._supportedOperationsN:
-        if t == latexexpr_efficalc._ADD:
-            sympyOp = sympy.Add
-        elif t == latexexpr_efficalc._MUL:
-            sympyOp = sympy.Mul
-        # elif t == latexexpr_efficalc._MAX: sympyOp = sympy.add.Add # TODO
-        # elif t == latexexpr_efficalc._MIN: sympyOp = sympy.add.Add # TODO
-        args = [_o2s(a, varMap, sf) for a in arg.args]
-        return sympyOp(*args), varMap
-    if t in latexexpr_efficalc._supportedOperations2:
-        a = arg.args
-        if t == latexexpr_efficalc._SUB:
-            sympyOp, args = sympy.Add, (
-                _o2s(a[0], varMap, sf),
-                sympy.Mul(-1, _o2s(a[1], varMap, sf)),
-            )
-        elif t == latexexpr_efficalc._DIV or t == latexexpr_efficalc._DIV2:
-            sympyOp, args = sympy.Mul, (
-                _o2s(a[0], varMap, sf),
-                sympy.power.Pow(_o2s(a[1], varMap, sf), -1),
+    if memo is None:
+        memo = {}
+    _collect_symbolic_vars(arg, varMap, sf)
+    # explicit post-order walk: a node stays on the stack until all of its
+    # arguments are in `done`, then it is built in a single handler call.
+    # This keeps deep trees from hitting Python's recursion limit and avoids
+    # one interpreter frame per node. Operation nodes are additionally
+    # memoized by identity, so shared subtrees are converted only once
+    done = {}
+    stack = [arg]
+    while stack:
+        node = stack[-1]
+        key = id(node)
+        if key in done:
+            stack.pop()
+            continue
+        kind = getattr(node, "_KIND", None)
+        if kind == "variable":
+            done[key] = _variable_to_sympy(node, sf, memo)
+            stack.pop()
+            continue
+        if sf and kind is not None and not node.is_symbolic():
+            # substituteFloats fast path: an all-numeric subtree folds to its
+            # float value through the package's own evaluator, without
+            # building any backend nodes for its internals
+            done[key] = float(node)
+            stack.pop()
+            continue
+        if kind == "expression":
+            inner = node.operation
+        elif kind != "operation":
+            raise TypeError("TODO " + str(type(node)) + str(node))
+        elif node.type in _TRANSPARENT_OPS:
+            inner = node.args[0]
+        else:
+            inner = None
+        if inner is not None:
+            if id(inner) in done:
+                done[key] = done[id(inner)]
+                stack.pop()
+            else:
+                stack.append(inner)
+            continue
+        cached = memo.get(key)
+        if cached is not None:
+            done[key] = cached
+            stack.pop()
+            continue
+        pending = [a for a in node.args if id(a) not in done]
+        if pending:
+            stack.extend(pending)
+            continue
+        handler = _OP_TABLE.get(node.type)
+        if handler is None:
+            raise latexexpr_efficalc.LaTeXExpressionError(
+                "operation %s is not supported by latexexpr_efficalc.sympy"
+                % node.type
             )
-        elif t == latexexpr_efficalc._POW:
-            sympyOp, args = sympy.Pow, (_o2s(a[0], varMap, sf), _o2s(a[1], varMap, sf))
-        elif t == latexexpr_efficalc._ROOT:
-            sympyOp, args = sympy.Pow, (_o2s(a[0], varMap, sf), _o2s(-a[1], varMap, sf))
-        elif t == latexexpr_efficalc._LOG:
-            sympyOp, args = sympy.log, (_o2s(a[0], varMap, sf), _o2s(a[1], varMap, sf))
-        return sympyOp(*args), varMap
-    if t in latexexpr_efficalc._supportedOperations1:
-        a = arg.args[0]
-        if t == latexexpr_efficalc._NEG:
-            sympyOp, args = sympy.Mul, (_o2s(a, varMap, sf), -1)
-        elif t == latexexpr_efficalc._ABS:
-            sympyOp, args = sympy.Abs, None
-        elif t == latexexpr_efficalc._SQR:
-            sympyOp, args = sympy.Pow, (_o2s(a, varMap, sf), 2)
-        elif t == latexexpr_efficalc._SQRT:
-            sympyOp, args = sympy.Pow, (_o2s(a, varMap, sf), -2)
-        elif t == latexexpr_efficalc._SIN:
-            sympyOp, args = sympy.sin, None
-        elif t == latexexpr_efficalc._COS:
-            sympyOp, args = sympy.cos, None
-        elif t == latexexpr_efficalc._TAN:
-            sympyOp, args = sympy.tan, None
-        elif t == latexexpr_efficalc._SINH:
-            sympyOp, args = sympy.sinh, None
-        elif t == latexexpr_efficalc._COSH:
-            sympyOp, args = sympy.sinh, None
-        elif t == latexexpr_efficalc._TANH:
-            sympyOp, args = sympy.sinh, None
-        elif t == latexexpr_efficalc._EXP:
-            sympyOp, args = sympy.exp, None
-        elif t == latexexpr_efficalc._LN:
-            sympyOp, args = sympy.log, None
-        elif t == latexexpr_efficalc._LOG10:
-            sympyOp, args = sympy.log, (a, 10)  # TODO check formula
-        elif t in (
-            latexexpr_efficalc._NONE,
-            latexexpr_efficalc._RBRACKETS,
-            latexexpr_efficalc._SBRACKETS,
-            latexexpr_efficalc._CBRACKETS,
-            latexexpr_efficalc._ABRACKETS,
-            latexexpr_efficalc._POS,
-        ):
-            return _operation_to_sympy(a, varMap, sf)
-        if args is None:
-            args = (_o2s(a, varMap, sf),)
-        return sympyOp(*args), varMap
-    raise latexexpr_efficalc.LaTeXExpressionError("TODO")
-
-
-def _o2s(arg, varMap, substituteFloats):
-    return _operation_to_sympy(arg, varMap, substituteFloats)[0]
+        ret = handler(*(done[id(a)] for a in node.args))
+        memo[key] = done[key] = ret
+        stack.pop()
+    return done[id(arg)], varMap
+
+
+def _o2s(arg, varMap, substituteFloats, memo=None):
+    return _operation_to_sympy(arg, varMap, substituteFloats, memo)[0]
+
+
+def _copy_expression(expr):
+    # typed shallow copy of an Expression, cheaper than copy.copy and
+    # explicit about which fields the simplify-like functions may rebind
+    ret = latexexpr_efficalc.Expression.__new__(latexexpr_efficalc.Expression)
+    ret.name = expr.name
+    ret.operation = expr.operation
+    ret.unit = expr.unit
+    ret.format = expr.format
+    ret.unit_format = expr.unit_format
+    ret.exponent = expr.exponent
+    return ret
+
+
+def _trivial_result(arg):
+    # returns the result of any simplify-like function without the sympy
+    # round trip when the argument is already in simplest form: a chain of
+    # typographic wrappers around a single symbolic Variable collapses to
+    # that Variable, exactly as the full round trip would
+    node = arg
+    while (
+        getattr(node, "_KIND", None) == "operation"
+        and node.type in _TRANSPARENT_OPS
+    ):
+        node = node.args[0]
+    if getattr(node, "_KIND", None) == "variable" and node.is_symbolic():
+        return node
+    return None
+
+
+# expressions with at least this many operations are CSE-reduced before
+# sympy.simplify; small trees are simplified directly so simplification
+# across shared subexpressions is not hindered
+_CSE_THRESHOLD = 64
+
+
+def _simplify_sympy(s, fast=True, **kw):
+    s = sympy.sympify(s)
+    if fast:
+        # cheap canonical forms do not need the full heuristic simplify,
+        # which tries many transformations and scores the outcomes:
+        # polynomials just expand, rational functions combine and cancel.
+        # fast=False forces the sympy.simplify route (keeping e.g. factored
+        # polynomials factored)
+        if s.is_polynomial():
+            # doit() re-evaluates the unevaluated Add/Mul nodes (combining
+            # like terms), which expand alone leaves untouched
+            return _apply_backend("expand", s.doit())
+        if s.is_rational_function():
+            return sympy.cancel(sympy.together(s))
+    if s.count_ops() >= _CSE_THRESHOLD:
+        replacements, reduced = sympy.cse(s)
+        if replacements:
+            s = sympy.sympify(_apply_backend("simplify", reduced[0], **kw))
+            for symb, sub in reversed(replacements):
+                s = s.subs(symb, sub)
+            return s
+    return _apply_backend("simplify", s, **kw)
+
+
+# unary sympy functions and the Operation constructors rebuilding them,
+# keyed by the sympy class (== expr.func) for one-lookup dispatch
+_S2O_UNARY = {
+    sympy.Abs: latexexpr_efficalc.absolute,
+    sympy.sin: latexexpr_efficalc.sin,
+    sympy.cos: latexexpr_efficalc.cos,
+    sympy.tan: latexexpr_efficalc.tan,
+    sympy.sinh: latexexpr_efficalc.sinh,
+    sympy.cosh: latexexpr_efficalc.cosh,
+    sympy.tanh: latexexpr_efficalc.tanh,
+    sympy.log: latexexpr_efficalc.ln,
+}
+
+
+def _sympy2operation(sympyExpr, varMap, memo=None):
+    # explicit post-order walk mirroring _operation_to_sympy: a node is
+    # rebuilt once all of its arguments are converted. The memo is keyed by
+    # identity; sympy interns common subexpressions, so repeated nodes reuse
+    # the Operation built on first encounter
+    if memo is None:
+        memo = {}
+    stack = [sympyExpr]
+    while stack:
+        node = stack[-1]
+        key = id(node)
+        if key in memo:
+            stack.pop()
+            continue
+        pending = [a for a in node.args if id(a) not in memo]
+        if pending:
+            stack.extend(pending)
+            continue
+        memo[key] = _sympy2operation_node(
+            node, [memo[id(a)] for a in node.args], varMap
+        )
+        stack.pop()
+    return memo[id(sympyExpr)]
 
 
-def _sympy2operation(sympyExpr, varMap):
+def _sympy2operation_node(sympyExpr, args, varMap):
     if sympyExpr.is_Float or sympyExpr.is_Integer:
-        if isinstance(sympyExpr, sympy.numbers.Exp1):
-            name = "e"
-        elif isinstance(sympyExpr, sympy.numbers.Pi):
-            name = r"\pi"
+        if isinstance(sympyExpr, sympy.core.numbers.Exp1):
+            return latexexpr_efficalc.Variable("e", float(sympyExpr))
+        if isinstance(sympyExpr, sympy.core.numbers.Pi):
+            return latexexpr_efficalc.Variable(r"\pi", float(sympyExpr))
         # TODO?
-        else:
-            name = "%g" % float(sympyExpr)
-        return latexexpr_efficalc.Variable(name, float(sympyExpr))
+        return _literal("%g" % float(sympyExpr), float(sympyExpr))
     #
     if isinstance(sympyExpr, sympy.Symbol):
         return varMap[sympyExpr.name]
-    args = [_s2o(a, varMap) for a in sympyExpr.args]
     if isinstance(sympyExpr, sympy.Add):
+        # one pass splitting negated terms off, so a sum with K negations
+        # becomes add(...) - add(...) instead of K nested NEG wrappers
+        pos = []
+        neg = []
+        for a in args:
+            if (
+                isinstance(a, latexexpr_efficalc.Operation)
+                and a.type == latexexpr_efficalc._NEG
+            ):
+                neg.append(a.args[0])
+            else:
+                pos.append(a)
+        if not neg:
+            return latexexpr_efficalc.add(*pos)
+        negSum = neg[0] if len(neg) == 1 else latexexpr_efficalc.add(*neg)
         if (
-            len(args) == 2
-            and isinstance(args[1], latexexpr_efficalc.Operation)
-            and args[1].type == latexexpr_efficalc._NEG
+            isinstance(negSum, latexexpr_efficalc.Operation)
+            and negSum.type
+            in (latexexpr_efficalc._ADD, latexexpr_efficalc._SUB)
         ):
-            args[1] = args[1].args[0]
-            return latexexpr_efficalc.sub(*args)
-        return latexexpr_efficalc.add(*args)
+            # bracket the grouped negative part so the rendered subtraction
+            # stays unambiguous
+            negSum = latexexpr_efficalc.brackets(negSum)
+        if not pos:
+            return -negSum
+        posSum = pos[0] if len(pos) == 1 else latexexpr_efficalc.add(*pos)
+        return latexexpr_efficalc.sub(posSum, negSum)
     if isinstance(sympyExpr, sympy.Mul):
         if len(args) == 2:
             if (
@@ -221,6 +499,8 @@ def _sympy2operation(sympyExpr, varMap):
         return latexexpr_efficalc.mul(*args)
     if isinstance(sympyExpr, sympy.Pow):
         if len(args) == 2:
+            if sympyExpr.args[1] is sympy.S.Half:
+                return latexexpr_efficalc.sqrt(args[0])
             n = (
                 args[1].name
                 if isinstance(args[1], latexexpr_efficalc.Variable)
@@ -231,7 +511,7 @@ def _sympy2operation(sympyExpr, varMap):
             if n == "2":
                 return args[0] ** 2
             if n == "0.5":
-                return latexexpr_efficalc._SQRT(args[1])
+                return latexexpr_efficalc.sqrt(args[0])
         # TODO arg ^ int?
         a = args[0]
         t = (
@@ -246,30 +526,15 @@ def _sympy2operation(sympyExpr, varMap):
         if t in (latexexpr_efficalc._ADD, latexexpr_efficalc._SUB):  # TODO?
             args[0] = latexexpr_efficalc.brackets(a)
         return args[0] ** args[1]
-    for s, l in (
-        (sympy.Abs, latexexpr_efficalc.absolute),
-        (sympy.sin, latexexpr_efficalc.sin),
-        (sympy.cos, latexexpr_efficalc.cos),
-        (sympy.tan, latexexpr_efficalc.tan),
-        (sympy.sinh, latexexpr_efficalc.sinh),
-        (sympy.cosh, latexexpr_efficalc.cosh),
-        (sympy.tanh, latexexpr_efficalc.tanh),
-        (sympy.tanh, latexexpr_efficalc.tanh),
-        (sympy.log, latexexpr_efficalc.ln),
-    ):
-        if isinstance(sympyExpr, s):
-            return l(args[0])
+    unaryOp = _S2O_UNARY.get(sympyExpr.func)
+    if unaryOp is not None:
+        return unaryOp(args[0])
     if isinstance(sympyExpr, sympy.Rational):
         p, q = sympyExpr.p, sympyExpr.q
         if p > 0:
-            return latexexpr_efficalc.Variable(str(p), p) / latexexpr_efficalc.Variable(
-                str(q), q
-            )
+            return _literal(str(p), p) / _literal(str(q), q)
         p = -p
-        return -(
-            latexexpr_efficalc.Variable(str(p), p)
-            / latexexpr_efficalc.Variable(str(q), q)
-        )
+        return -(_literal(str(p), p) / _literal(str(q), q))
     #
     # TODO
     raise latexexpr_efficalc.LaTeXExpressionError("TODO")
@@ -278,11 +543,59 @@ def _sympy2operation(sympyExpr, varMap):
 _s2o = _sympy2operation
 
 
-def simplify(arg, substituteFloats=False, **kw):
+def _transform(
+    arg,
+    name,
+    applySympy,
+    substituteFloats,
+    kw,
+    _Var=latexexpr_efficalc.Variable,
+    _Expr=latexexpr_efficalc.Expression,
+    _Op=latexexpr_efficalc.Operation,
+):
+    # shared dispatch body of the six public functions: Variables pass
+    # through, Expressions are copied with a transformed operation, Operations
+    # make the sympy round trip with applySympy(s, **kw) in the middle. The
+    # efficalc classes are bound as defaults so each call reads locals instead
+    # of re-resolving module attributes
+    if isinstance(arg, _Var):
+        return arg
+    if isinstance(arg, _Expr):
+        ret = _copy_expression(arg)
+        ret.operation = _transform(
+            arg.operation, name, applySympy, substituteFloats, kw
+        )
+        return ret
+    if isinstance(arg, _Op):
+        trivial = _trivial_result(arg)
+        if trivial is not None:
+            return trivial
+        s, lVars = _operation_to_sympy(arg, substituteFloats=substituteFloats)
+        return _sympy2operation(applySympy(s, **kw), lVars)
+    raise TypeError(
+        "Unsupported type (%s) for %s" % (arg.__class__.__name__, name)
+    )
+
+
+def _backend_fn(name):
+    def apply(s, **kw):
+        return _apply_backend(name, s, **kw)
+
+    return apply
+
+
+_expand_sympy = _backend_fn("expand")
+_factor_sympy = _backend_fn("factor")
+_cancel_sympy = _backend_fn("cancel")
+_apart_sympy = _backend_fn("apart")
+
+
+def simplify(arg, substituteFloats=False, fast=True, **kw):
     r"""Performs simplify operation on arg. Symbolic variables are left symbolic, but variables with values are treated as the values (!)
 
     :param Variable|Operation|Expression arg: argument to be processed
     :param bool substituteFloats: non-symbolic variables are treated as their float values if True, they are left otherwise
+    :param bool fast: polynomials are expanded and rational functions combined and cancelled directly if True (skipping sympy's much slower heuristic simplify, but e.g. expanding factored polynomials); sympy.simplify() semantics are used if False
     :param \*\*kw: keywords for sympy.simplify() function
     :rtype: type(arg)
 
@@ -298,12 +611,12 @@ def simplify(arg, substituteFloats=False, **kw):
             >>> print e1
             e1 = {v1} + {v1} + {v2} + {v3} + {v2} + {v3} - {v4}
             >>> print lsympy.simplify(e1)
-            e1 = \left( - {v4} \right) + {2} \cdot {v1} + {2} \cdot {v2} + {2} \cdot {v3}
+            e1 = {2} \cdot {v1} + {2} \cdot {v2} + {2} \cdot {v3} - {v4}
             >>> print lsympy.simplify(e1,substituteFloats=True)
             e1 = {-2.1} + {2} \cdot {v1} + {2} \cdot {v2}
             >>> e1.simplify()
             >>> print e1
-            e1 = \left( - {v4} \right) + {2} \cdot {v1} + {2} \cdot {v2} + {2} \cdot {v3}
+            e1 = {2} \cdot {v1} + {2} \cdot {v2} + {2} \cdot {v3} - {v4}
             >>> e1.simplify(substituteFloats=True)
             >>> print e1
             e1 = {-2.1} + {2} \cdot {v1} + {2} \cdot {v2}
@@ -314,30 +627,93 @@ def simplify(arg, substituteFloats=False, **kw):
             >>> print lsympy.simplify(e3)
             e3 = {-1} + {x}
     """
-    if isinstance(arg, latexexpr_efficalc.Variable):
-        return arg
-    if isinstance(arg, latexexpr_efficalc.Expression):
-        ret = copy.copy(arg)
-        ret.simplify(substituteFloats, **kw)
-        return ret
-    if isinstance(arg, latexexpr_efficalc.Operation):
-        s, lVars = _operation_to_sympy(arg, substituteFloats=substituteFloats)
-        s = sympy.simplify(s, **kw)
-        return _sympy2operation(s, lVars)
-    raise TypeError("Unsupported type (%s) for simplify" % (arg.__class__.__name__))
+    return _transform(
+        arg, "simplify", _simplify_sympy, substituteFloats, dict(kw, fast=fast)
+    )
 
 
-latexexpr_efficalc.Expression.simplify = (
-    lambda self, substituteFloats=False, **kw: _setOperation(
-        self, simplify(self.operation, substituteFloats=substituteFloats, **kw)
-    )
-)
+def simplify_many(args, substituteFloats=False, fast=True, **kw):
+    r"""Performs simplify operation on a sequence of arguments at once, as if :func:`.simplify` was called on each. Related expressions usually share subtrees; those are converted once, factored out by a single sympy.cse() run over the whole list and simplified once, so the cost is amortised across the batch instead of being paid per call.
 
-latexexpr_efficalc.Operation.simplify = (
-    lambda self, substituteFloats=False, **kw: _copyOperation(
-        self, simplify(self, substituteFloats=substituteFloats, **kw)
-    )
-)
+    :param [Variable|Operation|Expression] args: arguments to be processed
+    :param bool substituteFloats: non-symbolic variables are treated as their float values if True, they are left otherwise
+    :param bool fast: same meaning as for :func:`.simplify`
+    :param \*\*kw: keywords for sympy.simplify() function
+    :rtype: [type(arg)]
+
+    .. code-block:: python
+
+            >>> import latexexpr_efficalc.sympy as lsympy
+            >>> v1 = latexexpr_efficalc.Variable('v1',None)
+            >>> v2 = latexexpr_efficalc.Variable('v2',None)
+            >>> e1 = latexexpr_efficalc.Expression('e1',v1+v1+v2+v2)
+            >>> e2 = latexexpr_efficalc.Expression('e2',(v1+v1+v2+v2)*v1)
+            >>> for e in lsympy.simplify_many([e1,e2]):
+            ...     print e
+            e1 = {2} \cdot {v1} + {2} \cdot {v2}
+            e2 = {v1} \cdot \left( {2} \cdot {v1} + {2} \cdot {v2} \right)
+    """
+    varMap = {}
+    memo = {}
+    results = [None] * len(args)
+    pending = []
+    sympyList = []
+    for i, arg in enumerate(args):
+        if isinstance(arg, latexexpr_efficalc.Variable):
+            results[i] = arg
+            continue
+        if isinstance(arg, latexexpr_efficalc.Expression):
+            op = arg.operation
+        elif isinstance(arg, latexexpr_efficalc.Operation):
+            op = arg
+        else:
+            raise TypeError(
+                "Unsupported type (%s) for simplify" % (arg.__class__.__name__)
+            )
+        trivial = _trivial_result(op)
+        if trivial is not None:
+            if isinstance(arg, latexexpr_efficalc.Expression):
+                ret = _copy_expression(arg)
+                ret.operation = trivial
+                results[i] = ret
+            else:
+                results[i] = trivial
+            continue
+        pending.append(i)
+        # one varMap and one memo for the whole batch, so a subtree shared
+        # by several arguments is converted only once
+        sympyList.append(
+            sympy.sympify(_o2s(op, varMap, substituteFloats, memo))
+        )
+    if sympyList:
+        replacements, reduced = sympy.cse(sympyList)
+        if replacements:
+            # simplify each shared subexpression and each reduced form once,
+            # then re-inline the subexpressions in reverse definition order
+            subs = [
+                (symb, sympy.sympify(_simplify_sympy(sub, fast=fast, **kw)))
+                for symb, sub in replacements
+            ]
+            simplified = []
+            for r in reduced:
+                r = sympy.sympify(_simplify_sympy(r, fast=fast, **kw))
+                for symb, sub in reversed(subs):
+                    r = r.subs(symb, sub)
+                simplified.append(r)
+            reduced = simplified
+        else:
+            reduced = [_simplify_sympy(r, fast=fast, **kw) for r in reduced]
+        s2oMemo = {}
+        for i, s in zip(pending, reduced):
+            op = _sympy2operation(s, varMap, s2oMemo)
+            arg = args[i]
+            if isinstance(arg, latexexpr_efficalc.Expression):
+                ret = _copy_expression(arg)
+                ret.operation = op
+                results[i] = ret
+            else:
+                results[i] = op
+    return results
 
 
 def expand(arg, substituteFloats=False, **kw):
@@ -357,35 +733,12 @@ def expand(arg, substituteFloats=False, **kw):
             e1 = {1} + {2} \cdot {x} + { {x} }^{ {2} }
             >>> e2 = latexexpr_efficalc.Expression('e2', (x+2)*(x-3) )
             >>> print lsympy.expand(e2)
-            e2 = {-6} + \left( - {x} \right) + { {x} }^{ {2} }
+            e2 = {-6} + {\left( {x} \right)}^{ {2} } - {x}
             >>> e3 = latexexpr_efficalc.Expression('e3', (x+1)*(x-2) - (x-1)*x )
             >>> print lsympy.expand(e3)
             e3 = -2 = \left( -2 \right) \ \mathrm{} = \left(-2\right) \ \mathrm{}
     """
-    if isinstance(arg, latexexpr_efficalc.Variable):
-        return arg
-    if isinstance(arg, latexexpr_efficalc.Expression):
-        ret = copy.copy(arg)
-        ret.expand(substituteFloats, **kw)
-        return ret
-    if isinstance(arg, latexexpr_efficalc.Operation):
-        s, lVars = _operation_to_sympy(arg, substituteFloats=substituteFloats)
-        s = sympy.expand(s, **kw)
-        return _sympy2operation(s, lVars)
-    raise TypeError("Unsupported type (%s) for expand" % (arg.__class__.__name__))
-
-
-latexexpr_efficalc.Expression.expand = (
-    lambda self, substituteFloats=False, **kw: _setOperation(
-        self, expand(self.operation, substituteFloats=substituteFloats, **kw)
-    )
-)
-
-latexexpr_efficalc.Operation.expand = (
-    lambda self, substituteFloats=False, **kw: _copyOperation(
-        self, expand(self, substituteFloats=substituteFloats, **kw)
-    )
-)
+    return _transform(arg, "expand", _expand_sympy, substituteFloats, kw)
 
 
 def factor(arg, substituteFloats=False, **kw):
@@ -409,30 +762,7 @@ def factor(arg, substituteFloats=False, **kw):
             >>> print lsympy.factor(e2)
             e2 = {z} \cdot { {2} \cdot {y} + {x} }^{ {2} }
     """
-    if isinstance(arg, latexexpr_efficalc.Variable):
-        return arg
-    if isinstance(arg, latexexpr_efficalc.Expression):
-        ret = copy.copy(arg)
-        ret.factor(substituteFloats, **kw)
-        return ret
-    if isinstance(arg, latexexpr_efficalc.Operation):
-        s, lVars = _operation_to_sympy(arg, substituteFloats=substituteFloats)
-        s = sympy.factor(s, **kw)
-        return _sympy2operation(s, lVars)
-    raise TypeError("Unsupported type (%s) for factor" % (arg.__class__.__name__))
-
-
-latexexpr_efficalc.Expression.factor = (
-    lambda self, substituteFloats=False, **kw: _setOperation(
-        self, factor(self.operation, substituteFloats=substituteFloats, **kw)
-    )
-)
-
-latexexpr_efficalc.Operation.factor = (
-    lambda self, substituteFloats=False, **kw: _copyOperation(
-        self, factor(self, substituteFloats=substituteFloats, **kw)
-    )
-)
+    return _transform(arg, "factor", _factor_sympy, substituteFloats, kw)
 
 
 def collect(arg, syms, substituteFloats=False, **kw):
@@ -454,40 +784,27 @@ def collect(arg, syms, substituteFloats=False, **kw):
             >>> print lsympy.collect(e1,x)
             e1 = {-3} + { {x} }^{ {3} } + {x} \cdot \left( {1} + {y} \right) + { {x} }^{ {2} } \cdot \left( {2} - {z} \right)
     """
-    if isinstance(arg, latexexpr_efficalc.Variable):
-        return arg
-    if isinstance(arg, latexexpr_efficalc.Expression):
-        ret = copy.copy(arg)
-        ret.collect(syms, substituteFloats, **kw)
-        return ret
-    if isinstance(arg, latexexpr_efficalc.Operation):
-        s, lVars = _operation_to_sympy(arg, substituteFloats=substituteFloats)
-        if not (
-            isinstance(syms, latexexpr_efficalc.Variable)
-            or all(isinstance(latexexpr_efficalc.Variable(s) for s in syms))
-        ):
-            raise latexexpr_efficalc.LaTeXExpressionError("TODO")
-        syms = (
-            sympy.Symbol(syms.name)
-            if isinstance(syms, latexexpr_efficalc.Variable)
-            else [sympy.Symbol(s.name) for s in syms]
-        )
-        s = sympy.collect(s, syms, **kw)
-        return _sympy2operation(s, lVars)
-    raise TypeError("Unsupported type (%s) for collect" % (arg.__class__.__name__))
-
-
-latexexpr_efficalc.Expression.collect = (
-    lambda self, syms, substituteFloats=False, **kw: _setOperation(
-        self, collect(self.operation, syms, substituteFloats=substituteFloats, **kw)
-    )
-)
+    def applySympy(s, **kw):
+        if isinstance(syms, latexexpr_efficalc.Variable):
+            symList = [syms]
+        elif all(isinstance(v, latexexpr_efficalc.Variable) for v in syms):
+            symList = list(syms)
+        else:
+            raise latexexpr_efficalc.LaTeXExpressionError(
+                "collect expects a Variable or an iterable of Variables, got %s"
+                % (syms,)
+            )
+        # deduplicate by name and reuse cached Symbols; repeated names would
+        # only make sympy.collect redo the same grouping
+        seen = set()
+        keys = []
+        for v in symList:
+            if v.name not in seen:
+                seen.add(v.name)
+                keys.append(sympy.sympify(_symbol(v.name)))
+        return sympy.collect(sympy.sympify(s), keys, **kw)
 
-latexexpr_efficalc.Operation.collect = (
-    lambda self, syms, substituteFloats=False, **kw: _copyOperation(
-        self, collect(self, syms, substituteFloats=substituteFloats, **kw)
-    )
-)
+    return _transform(arg, "collect", applySympy, substituteFloats, kw)
 
 
 def cancel(arg, substituteFloats=False, **kw):
@@ -514,30 +831,7 @@ def cancel(arg, substituteFloats=False, **kw):
             >>> print lsympy.cancel(e3)
             e3 = \frac{ {1} }{ {-1} + {x} } \cdot \left( { {z} }^{ {2} } + {-2} \cdot {y} \cdot {z} + { {y} }^{ {2} } \right)
     """
-    if isinstance(arg, latexexpr_efficalc.Variable):
-        return arg
-    if isinstance(arg, latexexpr_efficalc.Expression):
-        ret = copy.copy(arg)
-        ret.cancel(substituteFloats, **kw)
-        return ret
-    if isinstance(arg, latexexpr_efficalc.Operation):
-        s, lVars = _operation_to_sympy(arg, substituteFloats=substituteFloats)
-        s = sympy.cancel(s, **kw)
-        return _sympy2operation(s, lVars)
-    raise TypeError("Unsupported type (%s) for cancel" % (arg.__class__.__name__))
-
-
-latexexpr_efficalc.Expression.cancel = (
-    lambda self, substituteFloats=False, **kw: _setOperation(
-        self, cancel(self.operation, substituteFloats=substituteFloats, **kw)
-    )
-)
-
-latexexpr_efficalc.Operation.cancel = (
-    lambda self, substituteFloats=False, **kw: _copyOperation(
-        self, cancel(self, substituteFloats=substituteFloats, **kw)
-    )
-)
+    return _transform(arg, "cancel", _cancel_sympy, substituteFloats, kw)
 
 
 def apart(arg, substituteFloats=False, **kw):
@@ -554,32 +848,60 @@ def apart(arg, substituteFloats=False, **kw):
             >>> x = latexexpr_efficalc.Variable('x',None)
             >>> e1 = latexexpr_efficalc.Expression('e1', (4*x**3 + 21*x**2 + 10*x + 12) / (x**4 + 5*x**3 + 5*x**2 + 4*x) )
             >>> print lsympy.apart(e1)
-            e1 = \frac{ {1} }{ {1} + {x} + { {x} }^{ {2} } } \cdot \left( {-1} + {2} \cdot {x} \right) + \left( - \frac{ {1} }{ {4} + {x} } \right) + {3} \cdot \frac{ {1} }{ {x} }
+            e1 = {3} \cdot \frac{ {1} }{ {x} } + \frac{ {1} }{ {1} + {x} + {\left( {x} \right)}^{ {2} } } \cdot \left( {-1} + {2} \cdot {x} \right) - \frac{ {1} }{ {4} + {x} }
     """
-    if isinstance(arg, latexexpr_efficalc.Variable):
-        return arg
-    if isinstance(arg, latexexpr_efficalc.Expression):
-        ret = copy.copy(arg)
-        ret.apart(substituteFloats, **kw)
-        return ret
-    if isinstance(arg, latexexpr_efficalc.Operation):
-        s, lVars = _operation_to_sympy(arg, substituteFloats=substituteFloats)
-        s = sympy.apart(s, **kw)
-        return _sympy2operation(s, lVars)
-    raise TypeError("Unsupported type (%s) for apart" % (arg.__class__.__name__))
+    return _transform(arg, "apart", _apart_sympy, substituteFloats, kw)
 
 
-latexexpr_efficalc.Expression.apart = (
-    lambda self, substituteFloats=False, **kw: _setOperation(
-        self, apart(self.operation, substituteFloats=substituteFloats, **kw)
-    )
-)
+def _make_methods(func):
+    # one pair of instance methods per public function, replacing twelve
+    # hand-written lambdas; *args carries collect's extra syms argument
+    def exprMethod(self, *args, **kw):
+        _setOperation(self, func(self.operation, *args, **kw))
 
-latexexpr_efficalc.Operation.apart = (
-    lambda self, substituteFloats=False, **kw: _copyOperation(
-        self, apart(self, substituteFloats=substituteFloats, **kw)
-    )
-)
+    def opMethod(self, *args, **kw):
+        _copyOperation(self, func(self, *args, **kw))
+
+    return exprMethod, opMethod
+
+
+for _func in (simplify, expand, factor, collect, cancel, apart):
+    _exprMethod, _opMethod = _make_methods(_func)
+    setattr(latexexpr_efficalc.Expression, _func.__name__, _exprMethod)
+    setattr(latexexpr_efficalc.Operation, _func.__name__, _opMethod)
+del _func, _exprMethod, _opMethod
+
+
+def lambdify(arg, substituteFloats=True):
+    r"""Returns a plain numeric function evaluating arg, for repeated evaluation without re-walking the Operation tree. Symbolic variables become keyword arguments of the returned function; any variable left in the expression may be overridden the same way, otherwise its current value is used. If `numba <https://numba.pydata.org>`_ is installed, the generated function is JIT-compiled with numba.njit.
+
+    :param Variable|Operation|Expression arg: argument to be processed
+    :param bool substituteFloats: non-symbolic variables are baked in as their float values if True, they are left otherwise
+    :rtype: function
+
+    .. code-block:: python
+
+            >>> import latexexpr_efficalc.sympy as lsympy
+            >>> x = latexexpr_efficalc.Variable('x',None)
+            >>> f = lsympy.lambdify(x*x + 1)
+            >>> print f(x=3.)
+            10.0
+    """
+    s, lVars = _operation_to_sympy(arg, substituteFloats=substituteFloats)
+    s = sympy.sympify(s)
+    names = sorted(lVars)
+    syms = [sympy.Symbol(n) for n in names]
+    if _numba is not None:
+        func = _numba.njit(sympy.lambdify(syms, s, "numpy"))
+    else:
+        func = sympy.lambdify(syms, s, "math")
+
+    def fn(**kw):
+        return float(
+            func(*(kw[n] if n in kw else float(lVars[n]) for n in names))
+        )
+
+    return fn
 
 
 # TODO other simplify-like functions?
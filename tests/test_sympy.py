@@ -0,0 +1,117 @@
+import math
+
+import pytest
+
+from latexexpr_efficalc import (
+    Expression,
+    LaTeXExpressionError,
+    Variable,
+    cosh,
+    log10,
+    root,
+    sqrt,
+    tanh,
+)
+
+lsympy = pytest.importorskip("latexexpr_efficalc.sympy")
+
+
+def test_simplify_combines_repeated_variables():
+    v1 = Variable("v1", None)
+    v2 = Variable("v2", None)
+    e1 = Expression("e1", v1 + v1 + v2 + v2)
+    assert (
+        str(lsympy.simplify(e1)) == "e1 = {2} \\cdot {v1} + {2} \\cdot {v2}"
+    )
+
+
+def test_simplify_fast_false_keeps_factored_form():
+    x = Variable("x", None)
+    e = Expression("e", (x + 1) ** 2)
+    assert (
+        str(lsympy.simplify(e, fast=False))
+        == "e = {\\left( {1} + {x} \\right)}^{ {2} }"
+    )
+
+
+def test_simplify_many_matches_individual_calls():
+    v1 = Variable("v1", 2.0)
+    v2 = Variable("v2", 3.0)
+    e1 = Expression("e1", v1 + v1 + v2 + v2)
+    e2 = Expression("e2", (v1 + v1 + v2 + v2) * v1)
+    r1, r2 = lsympy.simplify_many([e1, e2])
+    assert str(r1) == str(lsympy.simplify(e1))
+    assert r1.result() == pytest.approx(10.0)
+    assert r2.result() == pytest.approx(20.0)
+
+
+def test_simplify_cancels_rational_function():
+    x = Variable("x", None)
+    e = Expression("e", (x**3 + x**2 - x - 1) / (x**2 + 2 * x + 1))
+    assert str(lsympy.simplify(e)) == "e = {-1} + {x}"
+
+
+def test_simplify_preserves_sqrt_value():
+    x = Variable("x", 2.0)
+    e = lsympy.simplify(Expression("e", sqrt(x) + sqrt(x)))
+    assert e.result() == pytest.approx(2 * math.sqrt(2.0))
+
+
+def test_simplify_preserves_cosh_value():
+    x = Variable("x", 1.5)
+    e = lsympy.simplify(Expression("e", cosh(x)))
+    assert e.result() == pytest.approx(math.cosh(1.5))
+
+
+def test_simplify_preserves_tanh_value():
+    x = Variable("x", 1.5)
+    e = lsympy.simplify(Expression("e", tanh(x)))
+    assert e.result() == pytest.approx(math.tanh(1.5))
+
+
+def test_simplify_preserves_log10_value():
+    x = Variable("x", 100.0)
+    e = lsympy.simplify(Expression("e", log10(x)))
+    assert e.result() == pytest.approx(2.0)
+
+
+def test_simplify_preserves_root_value():
+    x = Variable("x", 8.0)
+    e = lsympy.simplify(Expression("e", root(3, x)))
+    assert e.result() == pytest.approx(2.0)
+
+
+def test_collect_accepts_variable_list():
+    x = Variable("x", None)
+    y = Variable("y", None)
+    e = Expression("e", x * y + x + y + 1)
+    assert str(lsympy.collect(e, [x, x])) == str(lsympy.collect(e, x))
+
+
+def test_collect_rejects_non_variables():
+    x = Variable("x", None)
+    e = Expression("e", x * x + x)
+    with pytest.raises(LaTeXExpressionError):
+        lsympy.collect(e, ["x"])
+
+
+def test_lambdify_symbolic_argument():
+    x = Variable("x", None)
+    f = lsympy.lambdify(x * x + 1)
+    assert f(x=3.0) == pytest.approx(10.0)
+
+
+def test_lambdify_uses_current_value():
+    x = Variable("x", 2.0)
+    f = lsympy.lambdify(sqrt(x), substituteFloats=False)
+    assert f() == pytest.approx(math.sqrt(2.0))
+    assert f(x=9.0) == pytest.approx(3.0)
+
+
+def test_expand_square():
+    x = Variable("x", None)
+    e = Expression("e", (x + 1) ** 2)
+    assert (
+        str(lsympy.expand(e))
+        == "e = {1} + {\\left( {x} \\right)}^{ {2} } + {2} \\cdot {x}"
+    )